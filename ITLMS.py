@@ -19,12 +19,27 @@ Functions:
     on_closing: Handles window close event
 """
 import cv2
+import numpy as np
 import tkinter as tk
-from PIL import Image, ImageTk
 from ultralytics import YOLO
+from ultralytics.engine.results import Results
+from ultralytics.nn.autobackend import AutoBackend
+from ultralytics.trackers.byte_tracker import BYTETracker
+from ultralytics.utils import YAML, IterableSimpleNamespace
+from ultralytics.utils.nms import non_max_suppression
+from ultralytics.utils.checks import check_yaml
+import torch
+import logging
+import queue
+import threading
 import time
 import os
 
+log = logging.getLogger("ITLMS")
+
+# OpenCV builds with CUDA can resize and convert display frames on the GPU
+HAS_CUDA = hasattr(cv2, "cuda") and cv2.cuda.getCudaEnabledDeviceCount() > 0
+
 class GUI:
     """
     Manages the graphical user interface for the traffic management system.
@@ -34,6 +49,8 @@ class GUI:
         frames: Dictionary of LabelFrames for each road
         labels: Dictionary of Labels for video display
         traffic_lights: Dictionary of Labels for traffic light status
+        display_buffers: Dictionary of preallocated display-sized frames
+        gpu_buffers: Dictionary of (frame, resized, rgb) GpuMats per road when HAS_CUDA
     """
     def __init__(self, root, video_paths_and_roads):
         """
@@ -48,6 +65,8 @@ class GUI:
         self.frames = {}
         self.labels = {}
         self.traffic_lights = {}
+        self.display_buffers = {}
+        self.gpu_buffers = {}
         for road in video_paths_and_roads:
             self.frames[road] = tk.LabelFrame(root, text=f"Traffic on  {road}", padx=10, pady=10)
             self.frames[road].grid(row=0 if int(road[-1]) % 2 == 1 else 1, column=int(road[-1]) // 3, padx=10, pady=10)
@@ -55,6 +74,9 @@ class GUI:
             self.labels[road].grid(row=0, column=0, padx=10, pady=10)
             self.traffic_lights[road] = tk.Label(self.frames[road], text="Traffic Light: Closed", fg="red")
             self.traffic_lights[road].grid(row=1, column=0, padx=10, pady=10)
+            self.display_buffers[road] = np.empty((400, 500, 3), np.uint8)
+            if HAS_CUDA:
+                self.gpu_buffers[road] = (cv2.cuda_GpuMat(), cv2.cuda_GpuMat(), cv2.cuda_GpuMat())
 
     def update_frame(self, road, frame):
         """
@@ -64,12 +86,20 @@ class GUI:
             road: Road identifier (e.g., "Road1")
             frame: Image frame to display
         """
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        frame = cv2.resize(frame, (500, 400))  
-        photo = ImageTk.PhotoImage(image=Image.fromarray(frame))
+        # Resize first so the colour conversion only touches the display-sized frame
+        if HAS_CUDA:
+            gpu_frame, gpu_resized, gpu_rgb = self.gpu_buffers[road]
+            gpu_frame.upload(frame)
+            cv2.cuda.resize(gpu_frame, (500, 400), dst=gpu_resized, interpolation=cv2.INTER_AREA)
+            cv2.cuda.cvtColor(gpu_resized, cv2.COLOR_BGR2RGB, dst=gpu_rgb)
+            frame = gpu_rgb.download(self.display_buffers[road])
+        else:
+            frame = cv2.resize(frame, (500, 400), dst=self.display_buffers[road], interpolation=cv2.INTER_AREA)
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame)
+        # Hand Tk the raw pixels as a binary PPM, skipping the PIL round-trip
+        photo = tk.PhotoImage(width=500, height=400, data=b"P6 500 400 255 " + frame.tobytes(), format="PPM")
         self.labels[road].configure(image=photo)
         self.labels[road].image = photo
-        self.root.update()  
 
     def update_traffic_display(self, traffic_lights):
         """
@@ -91,9 +121,28 @@ class VideoProcessor:
     
     Attributes:
         video_caps: Dictionary of VideoCapture objects per road
-        models: Dictionary of YOLO models per road
+        frame_periods: Dictionary of source frame intervals in seconds per road
+        display_period_ms: Interval of the display loop in milliseconds
+        model: YOLO detector shared by all roads
         trackers: Path to tracker configuration
-        road_data: Dictionary storing traffic data per road
+        track_conf: Detection confidence threshold for the tracker input
+        road_trackers: Dictionary of ByteTrack instances per road
+        detect_interval: Run detection on every Nth frame of a road
+        frame_idx: Number of frames read per road
+        last_results: Latest tracked YOLO result per road
+        read_queues: Dictionary of decoded frame queues per road
+        draw_queues: Dictionary of annotated frame queues per road
+        count_overlays: Cached count text overlay per road
+        roads: Road identifiers in row order of counts
+        road_index: Dictionary mapping roads to their row in counts
+        counts: Array of (ambulance, firefighter, police, car, traffic) counts per road
+        track_counts: Array of tracked object counts per road (0 until a road reports)
+        count_row: Scratch row the detection thread fills before publishing to counts
+        resized_frames: Preallocated 640x640 letterboxed BGR frames, one slot per road
+        net_input: Preallocated (roads, 3, 640, 640) model input tensor
+        backend: Ultralytics inference backend run directly on net_input
+        use_cuda_graphs: Whether the PyTorch forward pass is replayed from a CUDA graph
+        cuda_graph: Captured (graph, output) over every road's input slot, or None
     """
     def __init__(self, video_paths_and_roads):
         """
@@ -103,100 +152,273 @@ class VideoProcessor:
             video_paths_and_roads: Dictionary mapping road names to video paths
         """
         self.video_caps = {}
-        self.models = {}
+        self.frame_periods = {}
         for road, info in video_paths_and_roads.items():
             # Use os.path.join for cross-platform compatibility
             video_path = os.path.join("assets", os.path.basename(info["video_path"]))
             if not os.path.exists(video_path):
-                print(f"Error: Video file not found for {road}: {video_path}")
+                log.error("Video file not found for %s: %s", road, video_path)
                 continue
-            cap = cv2.VideoCapture(video_path)
+            # Ask FFmpeg for hardware decoding (NVDEC/VAAPI/...) and fall back to software
+            cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG,
+                                   [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
             if not cap.isOpened():
-                print(f"Error: Could not open video for {road}: {video_path}")
+                cap = cv2.VideoCapture(video_path)
+            if not cap.isOpened():
+                log.error("Could not open video for %s: %s", road, video_path)
                 continue
             self.video_caps[road] = cap
-            self.models[road] = YOLO(os.path.join('assets', 'best.pt'))
-        self.trackers = 'bytetrack.yaml' 
-        self.road_data = {}
+            # CAP_PROP_FPS is unreliable for live streams, so fall back to 30 FPS
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            self.frame_periods[road] = 1 / fps if 0 < fps <= 120 else 1 / 30
+        self.display_period_ms = max(1, round(1000 * min(self.frame_periods.values(), default=1 / 30)))
+        self.model = self.load_best_model()
+        self.trackers = 'bytetrack.yaml'
+        # Same detection confidence model.track() uses: ByteTrack's second
+        # association stage needs the low-confidence boxes
+        self.track_conf = 0.1
+        # Counts change slowly, so detection runs at a fraction of the display rate
+        self.detect_interval = 3
+        self.frame_idx = {road: 0 for road in self.video_caps}
+        self.last_results = {road: None for road in self.video_caps}
+        # The detector is shared, so each road keeps its own tracker state.
+        # Trackers only see detected frames and track_buffer counts tracker updates,
+        # so it is scaled to keep lost tracks as long as at 30 FPS on every frame.
+        tracker_cfg = YAML.load(check_yaml(self.trackers))
+        self.road_trackers = {}
+        for road in self.video_caps:
+            updates_per_second = 1 / (self.frame_periods[road] * self.detect_interval)
+            track_buffer = max(1, round(tracker_cfg["track_buffer"] * updates_per_second / 30))
+            self.road_trackers[road] = BYTETracker(IterableSimpleNamespace(**{**tracker_cfg, "track_buffer": track_buffer}))
+        # Bounded queues give back-pressure so decoding can't outrun detection
+        self.read_queues = {road: queue.Queue(maxsize=2) for road in self.video_caps}
+        self.draw_queues = {road: queue.Queue(maxsize=2) for road in self.video_caps}
+        self.count_overlays = {}
+        self.roads = list(self.video_caps.keys())
+        self.road_index = {road: i for i, road in enumerate(self.roads)}
+        self.counts = np.zeros((len(self.roads), 5), np.int32)
+        self.track_counts = np.zeros(len(self.roads), np.int32)
+        self.count_row = np.zeros(5, np.int32)
+        # Frames are letterboxed once into these buffers and passed to the model as a
+        # ready tensor instead of going through Ultralytics' preprocessing per call
+        self.resized_frames = np.empty((len(self.roads), 640, 640, 3), np.uint8)
+        device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+        self.net_input = torch.empty((len(self.roads), 3, 640, 640), dtype=torch.float32, device=device)
+        # The backend is called directly with NMS applied afterwards; predict would
+        # also copy the whole input batch back to the host to rebuild original images
+        self.backend = AutoBackend(model=self.model.model, device=device, fuse=True, verbose=False)
+        self.backend.eval()
+        # The input shape is fixed, so on a GPU the PyTorch model's forward pass is
+        # captured once as a CUDA graph
+        self.use_cuda_graphs = device.type == 'cuda' and self.backend.format == 'pt'
+        self.cuda_graph = None
+
+    def load_best_model(self):
+        """
+        Load the fastest exported detector found in assets, in order:
+        TensorRT engine, OpenVINO model, ONNX model, then the PyTorch weights.
+        Ultralytics picks the matching runtime from the file type.
+        
+        Returns:
+            YOLO: Detector shared by all roads
+        """
+        for name in ('best.engine', 'best_openvino_model', 'best.onnx'):
+            model_path = os.path.join('assets', name)
+            if os.path.exists(model_path):
+                return YOLO(model_path, task='detect')
+        weights_path = os.path.join('assets', 'best.pt')
+        if not os.path.exists(weights_path):
+            raise FileNotFoundError(f"Model weights not found: {weights_path}")
+        return YOLO(weights_path)
 
-    def process_video_frame(self, road, gui):
+    def capture_cuda_graph(self, net_input):
         """
-        Process a single video frame for a road.
+        Capture the PyTorch detector's forward pass on a fixed input batch.
         
         Args:
-            road: Road identifier
-            gui: GUI object for updating displays
+            net_input: Static input tensor read by every replay of the graph
+            
+        Returns:
+            tuple: CUDA graph and the output tensors it writes when replayed
+        """
+        model = self.backend
+        # Warm up on a side stream so cuDNN autotuning and the detection head's
+        # anchors are settled before capture
+        stream = torch.cuda.Stream()
+        stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(stream):
+            for _ in range(3):
+                model(net_input)
+        torch.cuda.current_stream().wait_stream(stream)
+
+        # Thread-local capture so CUDA work issued by the Tk thread (cv2.cuda
+        # display resizing) can't invalidate the capture
+        graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(graph, capture_error_mode="thread_local"):
+            output = model(net_input)
+        return graph, output
+
+    def letterbox(self, frame, dst):
+        """
+        Resize a frame into a 640x640 buffer keeping its aspect ratio, padding
+        the borders with gray (114) as Ultralytics' LetterBox does.
+        
+        Args:
+            frame: BGR image frame
+            dst: (640, 640, 3) buffer to write into
+            
+        Returns:
+            tuple: Scale factor and the left and top padding in pixels
+        """
+        height, width = frame.shape[:2]
+        scale = min(640 / height, 640 / width)
+        new_w, new_h = round(width * scale), round(height * scale)
+        left, top = (640 - new_w) // 2, (640 - new_h) // 2
+        dst[top:top + new_h, left:left + new_w] = cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+        # Slots are shared between roads, so the padding is refilled every time
+        dst[:top] = 114
+        dst[top + new_h:] = 114
+        dst[top:top + new_h, :left] = 114
+        dst[top:top + new_h, left + new_w:] = 114
+        return scale, left, top
+
+    def detect(self, net_input):
+        """
+        Run the shared detector on a preprocessed batch.
+        
+        Args:
+            net_input: (batch, 3, 640, 640) RGB tensor in [0, 1]
+            
+        Returns:
+            list: (n, 6) tensors of x1, y1, x2, y2, conf, class per image
+                in 640x640 input coordinates
+        """
+        with torch.inference_mode():
+            # The batch holds only the roads with a frame ready, so its size varies;
+            # the graph is captured once over every road's slot and the rows past
+            # the batch are dropped after replay
+            batch = net_input.shape[0]
+            if self.use_cuda_graphs and self.cuda_graph is None:
+                try:
+                    self.cuda_graph = self.capture_cuda_graph(self.net_input)
+                except (RuntimeError, TypeError):
+                    # TypeError: torch too old for capture_error_mode
+                    log.warning("CUDA graph capture failed, running the model without it", exc_info=True)
+                    self.use_cuda_graphs = False
+
+            if self.use_cuda_graphs:
+                graph, output = self.cuda_graph
+                graph.replay()
+                if isinstance(output, (list, tuple)):
+                    output = output[0]
+                output = output[:batch]
+            else:
+                output = self.backend(net_input)
+            return non_max_suppression(output, conf_thres=self.track_conf, iou_thres=0.7,
+                                       end2end=getattr(self.backend, 'end2end', False))
+
+    def track_frames(self, frames):
+        """
+        Run the shared detector on one frame per road as a single batch
+        and update each road's tracker.
+        
+        Args:
+            frames: Dictionary mapping roads to BGR image frames
             
         Returns:
-            bool: True if frame processed successfully, False otherwise
+            dict: YOLO result per road with track IDs attached to the boxes
+        """
+        batch = len(frames)
+        pads = [self.letterbox(frame, resized) for resized, frame in zip(self.resized_frames, frames.values())]
+        # Tensor inputs are expected as RGB in [0, 1], so flip the BGR channels
+        net_input = self.net_input[:batch]
+        net_input.copy_(torch.from_numpy(self.resized_frames[:batch]).permute(0, 3, 1, 2).flip(1), non_blocking=True)
+        net_input.div_(255)
+        detections = self.detect(net_input)
+
+        tracked = {}
+        for (road, frame), det, (scale, left, top) in zip(frames.items(), detections, pads):
+            # Undo the letterbox padding and scale to map boxes back to the frame
+            # before tracking
+            det = det.cpu()
+            boxes = (det[:, :4] - det.new_tensor((left, top, left, top))) / scale
+            det = torch.cat((boxes, det[:, 4:]), 1)
+            result = Results(frame, path=road, names=self.backend.names, boxes=det)
+            tracked[road] = result
+            if len(det) == 0:
+                continue
+            tracks = self.road_trackers[road].update(result.boxes.numpy(), frame)
+            if len(tracks) == 0:
+                continue
+            tracked[road] = result[tracks[:, -1].astype(int)]
+            tracked[road].update(boxes=torch.as_tensor(tracks[:, :-1]))
+        return tracked
+
+    def process_video_frame(self, road, frame, result):
         """
-        video_cap = self.video_caps[road]
-        road_counts = {"ambulance": 0, "firefighter": 0, "police": 0, "traffic": 0, "car": 0}
-
-        ret, frame = video_cap.read()
-        if ret:
-            results = self.models[road].track(frame, imgsz=640, persist=True, verbose=False, tracker=self.trackers)
-            boxes = results[0].boxes.xywh.cpu()
-
-            if results[0].boxes.id is not None:
-                track_ids = results[0].boxes.id.int().cpu().tolist()
-                track_clss = results[0].boxes.cls.int().cpu().tolist()
-
-                for track_id, track_cls, box in zip(track_ids, track_clss, boxes):
-                    x, y, w, h = box
-                    cls = track_cls
-
-                    normalized_threshold = 7000
-                    object_Area = w * h 
-                                
-                    if cls == 0:
-                        road_counts["ambulance"] += 1
-                    elif cls == 1:
-                        road_counts["firefighter"] += 1
-                    elif cls == 4:
-                        road_counts["police"] += 1
-                    elif cls == 3:
-                        road_counts["car"] += 1
-                    elif cls == 2:
-                        if object_Area > normalized_threshold:
-                            road_counts["traffic"] += 7 # Increment count by a smaller value for close objects
-                        else:
-                            road_counts["traffic"] += 13   # Increment count by a larger value for far objects
-                
-                    x_min = x - w / 2
-                    y_min = y - h / 2
-                    x_max = x + w / 2
-                    y_max = y + h / 2
-
-                    cv2.rectangle(frame, (int(x_min), int(y_min)), (int(x_max), int(y_max)), (0, 255, 0), 2)
-
-                    center_x = int((x_min + x_max) / 2)
-                    center_y = int((y_min + y_max) / 2)
-                    x_above = int(x_min + 5)
-                    y_above = int(y_min - 5)
-                    
-                    cv2.putText(frame, str(track_id), (x_above, y_above), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
-
-                # Update road data with counts and track_ids length
-                self.road_data[road] = [road_counts, len(track_ids)]
+        Count and annotate detections on a road's frame.
+        
+        Args:
+            road: Road identifier
+            frame: BGR image frame read for the road
+            result: Tracked YOLO result for the frame
+        """
+        if result.boxes.id is not None:
+            # One host copy of the tracked boxes: x1, y1, x2, y2, track id, conf, class
+            data = result.boxes.data.cpu().numpy()
+            corners = data[:, :4].astype(np.int32)
+            track_ids = data[:, 4].astype(np.int32).tolist()
+            track_clss = data[:, 6].astype(np.int64)
+
+            normalized_threshold = 7000
+            object_Areas = (data[:, 2] - data[:, 0]) * (data[:, 3] - data[:, 1])
+            traffic_mask = track_clss == 2
+
+            # Counts are built in a scratch row and published in one assignment,
+            # since the Tk thread reads self.counts for its light decisions
+            road_counts = self.count_row
+            class_counts = np.bincount(track_clss, minlength=5)
+            road_counts[:4] = class_counts[[0, 1, 4, 3]]  # ambulance, firefighter, police, car
+            # Close objects add a smaller value (7) than far objects (13)
+            road_counts[4] = (7 * (traffic_mask & (object_Areas > normalized_threshold)).sum()
+                              + 13 * (traffic_mask & (object_Areas <= normalized_threshold)).sum())
+            road_idx = self.road_index[road]
+            self.counts[road_idx] = road_counts
+            # Update the number of tracked objects for the road
+            self.track_counts[road_idx] = len(track_ids)
+
+            for track_id, (x_min, y_min, x_max, y_max) in zip(track_ids, corners.tolist()):
+                cv2.rectangle(frame, (x_min, y_min), (x_max, y_max), (0, 255, 0), 2)
+                cv2.putText(frame, str(track_id), (x_min + 5, y_min - 5), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
+
+            # Counts change slowly, so only re-render the text when they do
+            counts = (int(road_counts.sum()), *road_counts[[0, 1, 2, 4, 3]].tolist())
+            cached = self.count_overlays.get(road)
+            if cached is None or cached[0] != counts:
+                cached = (counts, *self.render_counts(counts))
+                self.count_overlays[road] = cached
+            _, overlay, mask = cached
+
+            # Draw counts on the frame
+            region = frame[20:20 + overlay.shape[0], :overlay.shape[1]]
+            height, width = region.shape[:2]
+            np.copyto(region, overlay[:height, :width], where=mask[:height, :width])
+
+    def render_counts(self, counts):
+        """
+        Render the vehicle count text into a small overlay strip.
+        
+        Args:
+            counts: Tuple of (total, ambulance, firefighter, police, traffic jam, cars)
             
-                road_counts_dict = self.road_data[road][0]
-
-                # Calculate the sum of values in road_counts_dict
-                total_count_road_counts = sum(road_counts_dict.values())
-                      
-                # Draw counts on the frame
-                cv2.putText(frame, f"Road Count: {total_count_road_counts}", (10, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
-                cv2.putText(frame, f"Ambulance: {self.road_data[road][0]['ambulance']}", (10, 80), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
-                cv2.putText(frame, f"Firefighter: {self.road_data[road][0]['firefighter']}", (10, 110), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
-                cv2.putText(frame, f"Police: {self.road_data[road][0]['police']}", (10, 140), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
-                cv2.putText(frame, f"Traffic jam: {self.road_data[road][0]['traffic']}", (10, 170), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
-                cv2.putText(frame, f"Cars: {self.road_data[road][0]['car']}", (10, 200), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
-
-            gui.update_frame(road, frame)
-       
-            traffic_system.process_and_update_traffic()  
-        return ret
+        Returns:
+            tuple: Overlay image and the mask of its text pixels
+        """
+        overlay = np.zeros((190, 400, 3), np.uint8)
+        labels = ("Road Count", "Ambulance", "Firefighter", "Police", "Traffic jam", "Cars")
+        for i, (label, count) in enumerate(zip(labels, counts)):
+            cv2.putText(overlay, f"{label}: {count}", (10, 30 + 30 * i), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
+        return overlay, overlay.any(axis=2, keepdims=True)
     
     def get_road_data(self):
         """
@@ -204,53 +426,148 @@ class VideoProcessor:
         
         Returns:
             dict: Road data containing vehicle counts and track IDs
+                for every road that has reported detections
         """
-        return self.road_data
+        keys = ("ambulance", "firefighter", "police", "car", "traffic")
+        return {road: [dict(zip(keys, self.counts[i].tolist())), int(self.track_counts[i])]
+                for road, i in self.road_index.items() if self.track_counts[i]}
     
-    def process_next_frame(self, road, gui):
+    def read_frames(self, road):
         """
-        Process the next video frame for a road and schedule the next frame.
+        Decode frames for a road into its read queue (reader thread).
+        A None frame marks the end of the video.
         
         Args:
             road: Road identifier
-            gui: GUI object for updating displays
         """
-        if road not in self.video_caps:
-            return
-            
         video_cap = self.video_caps[road]
-        if not video_cap.isOpened():
-            return
-            
-        ret = self.process_video_frame(road, gui)
-        if not ret:
-            video_cap.release()
-            del self.video_caps[road]
-            print(f"No more frames for {road}")
-            return
+        next_frame_time = time.monotonic()
+        while video_cap.isOpened():
+            ret, frame = video_cap.read()
+            if not ret:
+                break
+            self.read_queues[road].put(frame)
+            # Read at the source frame rate instead of as fast as the file decodes
+            next_frame_time += self.frame_periods[road]
+            delay = next_frame_time - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_frame_time = time.monotonic()
+        video_cap.release()
+        self.read_queues[road].put(None)
+
+    def detect_frames(self):
+        """
+        Run batched detection on the roads that have a frame ready and pass the
+        annotated frames to the draw queues (detection thread).
+        """
+        active_roads = list(self.read_queues.keys())
+        try:
+            while active_roads:
+                # Roads are not waited on in lock-step, so each one keeps the
+                # cadence of its own source instead of the slowest road's
+                frames = {}
+                for road in list(active_roads):
+                    try:
+                        frame = self.read_queues[road].get_nowait()
+                    except queue.Empty:
+                        continue
+                    if frame is None:
+                        active_roads.remove(road)
+                        self.draw_queues[road].put(None)
+                        continue
+                    frames[road] = frame
+                if not frames:
+                    time.sleep(0.002)
+                    continue
+
+                # Frames between detections are annotated with the last result
+                detect = {road: frame for road, frame in frames.items()
+                          if self.frame_idx[road] % self.detect_interval == 0 or self.last_results[road] is None}
+                if detect:
+                    self.last_results.update(self.track_frames(detect))
+                for road, frame in frames.items():
+                    self.frame_idx[road] += 1
+                    self.process_video_frame(road, frame, self.last_results[road])
+                    self.draw_queues[road].put(frame)
+        except Exception:
+            # Shut the display down cleanly instead of freezing on the last frame
+            log.exception("Detection stopped")
+            for road in active_roads:
+                self.draw_queues[road].put(None)
+
+    def newest_frame(self, road):
+        """
+        Take every frame waiting in a road's draw queue and keep the newest.
+        
+        Args:
+            road: Road identifier
             
-        # Schedule next frame processing
-        gui.root.after(10, lambda: self.process_next_frame(road, gui))
+        Returns:
+            tuple: Newest frame (None if there was none) and whether the video ended
+        """
+        frame = None
+        while True:
+            try:
+                item = self.draw_queues[road].get_nowait()
+            except queue.Empty:
+                return frame, False
+            if item is None:
+                return frame, True
+            frame = item
+
+    def draw_frames(self, gui):
+        """
+        Display the newest annotated frame of every road and schedule the
+        next check. Runs on the Tk main thread.
+        
+        Args:
+            gui: GUI object for updating displays
+        """
+        tick_start = time.monotonic()
+        drawn = False
+        for road in list(self.draw_queues.keys()):
+            # Older frames are skipped so a slow tick doesn't hold back the readers
+            frame, ended = self.newest_frame(road)
+            if frame is not None:
+                gui.update_frame(road, frame)
+                drawn = True
+            if ended:
+                del self.draw_queues[road]
+                del self.video_caps[road]
+                log.info("No more frames for %s", road)
+
+        # Update the traffic lights once per tick rather than once per road
+        if drawn:
+            traffic_system.process_and_update_traffic()
+
+        if self.draw_queues:
+            # Subtract the time spent drawing so ticks keep to the source frame rate
+            elapsed_ms = 1000 * (time.monotonic() - tick_start)
+            gui.root.after(max(1, round(self.display_period_ms - elapsed_ms)), self.draw_frames, gui)
         
     def start_processing(self, gui):
         """
-        Start processing all video feeds asynchronously.
+        Start the reader and detection threads and the display loop.
         
         Args:
             gui: GUI object for updating displays
         """
         for road in list(self.video_caps.keys()):
-            self.process_next_frame(road, gui)
+            threading.Thread(target=self.read_frames, args=(road,), daemon=True).start()
+        threading.Thread(target=self.detect_frames, daemon=True).start()
+        self.draw_frames(gui)
               
 class TrafficLightSystem:
     """
     Controls traffic light logic based on vehicle detection.
     
     Attributes:
-        video_processor: Reference to VideoProcessor instance
-        road_data: Current traffic data
+        video_processor: Reference to VideoProcessor instance whose counts are read
         traffic_lights: Dictionary of current light states per road
-        last_open_data: Records when roads were last opened
+        last_open_time: Array of timestamps when each road was last opened (0 = never)
+        open_idx: Row of the currently open road, or -1 if none is open
         gui: Reference to GUI instance
         last_open_time_em: Timestamp of last emergency vehicle detection
     """
@@ -262,9 +579,9 @@ class TrafficLightSystem:
             video_processor: VideoProcessor instance
         """
         self.video_processor = video_processor
-        self.road_data = None
-        self.traffic_lights = {road: False for road in video_processor.video_caps}  # Initialize with False for all roads
-        self.last_open_data = {}   
+        self.traffic_lights = {road: False for road in video_processor.roads}  # Initialize with False for all roads
+        self.last_open_time = np.zeros(len(video_processor.roads), np.float64)
+        self.open_idx = -1
         self.gui = None
         self.last_open_time_em = 0
 
@@ -285,12 +602,12 @@ class TrafficLightSystem:
             road: Road identifier
         """
         if not self.traffic_lights[road]:  # Check if already locked
-            print(f"Traffic light for {road} is already locked", "\n")
+            log.debug("Traffic light for %s is already locked", road)
             return
-        print("Before locking Traffic:", self.traffic_lights) 
-        print(f"Locking traffic light for {road}")
+        log.debug("Before locking Traffic: %s", self.traffic_lights)
+        log.debug("Locking traffic light for %s", road)
         self.traffic_lights[road] = False
-        print("After locking Traffic:", self.traffic_lights)  
+        log.debug("After locking Traffic: %s", self.traffic_lights)
 
     def unlock_traffic(self, road):
         """
@@ -300,12 +617,12 @@ class TrafficLightSystem:
             road: Road identifier
         """
         if self.traffic_lights[road]:  # Check if already unlocked
-            print(f"Traffic light for {road} is already unlocked", "\n")
+            log.debug("Traffic light for %s is already unlocked", road)
             return
-        print("Before unlocking Traffic:", self.traffic_lights)  
-        print(f"Unlocking traffic light for {road}")
+        log.debug("Before unlocking Traffic: %s", self.traffic_lights)
+        log.debug("Unlocking traffic light for %s", road)
         self.traffic_lights[road] = True
-        print("After unlocking Traffic:", self.traffic_lights, "\n")  
+        log.debug("After unlocking Traffic: %s", self.traffic_lights)
 
     def update_traffic_light(self):
         """
@@ -313,36 +630,41 @@ class TrafficLightSystem:
         1. Emergency vehicle presence (highest priority)
         2. Traffic density (when no emergencies)
         """
-        if self.road_data is None:
+        if not self.video_processor.track_counts.any():
             return 
 
-        road_counts = {road: data[0] for road, data in self.road_data.items()}
-   
-        has_emergency_vehicle = any(road_counts[r][vehicle] > 0 for r in road_counts for vehicle in ["ambulance", "firefighter", "police"])
+        roads = self.video_processor.roads
+        counts = self.video_processor.counts
+
+        # Columns 0-2 hold ambulance, firefighter and police counts
+        emergency_roads = counts[:, :3].any(axis=1)
+        has_emergency_vehicle = bool(emergency_roads.any())
       
         if has_emergency_vehicle:
-            # Priority order: ambulance > firefighter > police
-            for road, counts in road_counts.items():
-                if counts["ambulance"] > 0:
-                    self.update_traffic_with_lock(road, has_emergency_vehicle)
-                    break
-                elif counts["firefighter"] > 0:
-                    self.update_traffic_with_lock(road, has_emergency_vehicle)
-
-                    break
-                elif counts["police"] > 0:
-                    self.update_traffic_with_lock(road, has_emergency_vehicle)
-                    break
+            # The first road with any emergency vehicle gets priority
+            self.update_traffic_with_lock(roads[int(emergency_roads.argmax())], has_emergency_vehicle)
 
         else:
-    
-            total_count_road_counts = {road: sum(road_counts[road].values()) for road in road_counts}
+            max_count_road = roads[int(counts.sum(axis=1).argmax())]
+            self.update_traffic_with_lock(max_count_road)
 
-            max_count_road = max(total_count_road_counts, key=total_count_road_counts.get)
+    def open_road(self, road, now):
+        """
+        Lock the currently open road and unlock the given one.
+        
+        Args:
+            road: Road identifier
+            now: Timestamp recorded as the road's last open time
+        """
+        road_idx = self.video_processor.road_index[road]
+        if self.open_idx >= 0 and self.open_idx != road_idx:
+            self.lock_traffic(self.video_processor.roads[self.open_idx])
+        self.unlock_traffic(road)
+        self.last_open_time[road_idx] = now
+        self.open_idx = road_idx
 
-            for road in self.road_data.keys():
-                    if road == max_count_road:
-                       self.update_traffic_with_lock(road)
+        if self.gui:
+            self.gui.update_traffic_display(self.traffic_lights)
 
     def update_traffic_with_lock(self, road, has_emergency_vehicle=False):
         """
@@ -352,49 +674,24 @@ class TrafficLightSystem:
             road: Road identifier
             has_emergency_vehicle: Whether emergency vehicle is present
         """
+        if self.traffic_lights[road]:
+            return
 
-        try:
-            if has_emergency_vehicle and self.traffic_lights[road] == False:
-
-                for prev_road in self.last_open_data.keys():
-                        if self.last_open_data[prev_road]["open_road"] != road:
-                            self.lock_traffic(prev_road)
-
-                self.unlock_traffic(road)
-                self.last_open_data[road] = {"time": time.time(), "open_road": road}
-                self.last_open_time_em = time.time()
-
-                if self.gui:
-                    self.gui.update_traffic_display(self.traffic_lights)
-
-            else:
-                if (road in self.traffic_lights and
-                    self.traffic_lights[road] == False and
-                    time.time() - self.last_open_data.get(road, {}).get("time", 0) >= 10 and 
-                    has_emergency_vehicle == False and 
-                    time.time() - self.last_open_time_em >= 10):
-
-                    for prev_road in self.last_open_data.keys():
-                        if self.last_open_data[prev_road]["open_road"] != road:
-                            self.lock_traffic(prev_road)
-
-                    self.unlock_traffic(road)
-                    self.last_open_data[road] = {"time": time.time(), "open_road": road}
-                    self.last_open_time_em = 0
-
-                    if self.gui:
-                        self.gui.update_traffic_display(self.traffic_lights)         
+        now = time.time()
+        if has_emergency_vehicle:
+            self.open_road(road, now)
+            self.last_open_time_em = now
 
-        except KeyError:
-         
-                        self.last_open_data[road] = {"time": time.time(), "open_road": road}
+        elif (now - self.last_open_time[self.video_processor.road_index[road]] >= 10 and
+              now - self.last_open_time_em >= 10):
+            self.open_road(road, now)
+            self.last_open_time_em = 0
 
     def process_and_update_traffic(self):
         """
         Process road data and update traffic light states.
         Also updates the GUI display.
         """
-        self.road_data = self.video_processor.get_road_data()
         self.update_traffic_light()
 
     def check_and_open_overdue_road(self):
@@ -402,28 +699,25 @@ class TrafficLightSystem:
         Check for roads closed longer than 2 minutes and
         open the one with the most cars.
         """
-        current_time = time.time()
-        for road in self.last_open_data.keys():
-            if current_time - self.last_open_data[road]["time"] >= 120:  # 2 minutes
-                eligible_roads = [r for r in self.last_open_data if time.time() - self.last_open_data[r]["time"] >= 10 and self.road_data[r][0]["car"] > 0]
-                if eligible_roads:
-                    new_open_road = max(eligible_roads, key=lambda r: self.road_data[r][0]["car"])
-                    for prev_road in self.last_open_data.keys():
-                        if self.last_open_data[prev_road]["open_road"] != new_open_road:
-                            self.lock_traffic(prev_road)
-                    # Unlock the new road after locking the previous one
-                    self.unlock_traffic(new_open_road)
-                    self.last_open_data[new_open_road] = {"time": current_time, "open_road": new_open_road}
-             
-                
-                
-                    if self.gui:
-                        self.gui.update_traffic_display(self.traffic_lights)
-                break  
+        now = time.time()
+        opened = self.last_open_time > 0
+        if not (opened & (now - self.last_open_time >= 120)).any():  # 2 minutes
+            return
+
+        cars = self.video_processor.counts[:, 3]
+        eligible = opened & (now - self.last_open_time >= 10) & (cars > 0)
+        if eligible.any():
+            new_open_idx = int(np.where(eligible, cars, -1).argmax())
+            self.open_road(self.video_processor.roads[new_open_idx], now)
 
 
 if __name__ == "__main__":
 
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    # Traffic light transitions are only logged when ITLMS_DEBUG is set
+    if os.environ.get("ITLMS_DEBUG"):
+        log.setLevel(logging.DEBUG)
+
     def on_closing():
         """
         Handle application shutdown when window is closed.